@@ -11,67 +11,116 @@ includes the following Trigger subclasses (see :ref:`Guides/Rules:Extensions`
 for more details):
 """
 
-try:
-    # pylint: disable=unused-import
-    import typing
-    if typing.TYPE_CHECKING:
-        from core.jsr223.scope import (
-            itemRegistry as t_itemRegistry
-        )
-    # pylint: enable=unused-import
-except:
-    pass
-
 from core.jsr223.scope import scriptExtension
 scriptExtension.importPreset("RuleSupport")
 from core.jsr223.scope import ConditionBuilder, Configuration, Condition
-from core.utils import validate_uid
+from core.utils import validate_uid, _match_lowered, _lowered_groups
 from core.log import getLogger
 import re
 
-from os import path
-
-from org.openhab.core.thing import ChannelUID, ThingUID, ThingStatus
-from org.openhab.core.thing.type import ChannelKind
-from org.openhab.core.types import TypeParser
-
 # Lazy load itemRegistry
 itemRegistry = None
 def getItem(itemName):
     global itemRegistry
     if itemRegistry is None:
-        itemRegistry = scriptExtension.get("itemRegistry") # type: t_itemRegistry
+        itemRegistry = scriptExtension.get("itemRegistry")
     return itemRegistry.getItem(itemName)
 
 log = getLogger(u"core.onlyif")
 
+# Parsed condition arguments keyed by onlyif target string, since the same
+# literals recur across rules. Each use still builds its own Condition.
+_PARSE_CACHE = {}
+
+# Condition patterns, matched with core.utils._match_lowered, so their keywords
+# are lowercase
+_ITEM_NAME_PATTERN = r"(?P<itemName>\w+)"
+_ITEM_STATE_VALUE_PATTERN = r"(?P<state>'[^']+'|\S+)*"
+_ITEM_STATE_PATTERN = r"^item\s+" + _ITEM_NAME_PATTERN + r"\s+((?P<eq>=|==|eq|equals|is)|(?P<neq>!=|not\s+equals|is\s+not)|(?P<lt><|lt|is\s+less\s+than)|(?P<lte><=|lte|is\s+less\s+than\s+or\s+equal)|(?P<gt>>|gt|is\s+greater\s+than)|(?P<gte>>=|gte|is\s+greater\s+than\s+or\s+equal))\s+" + _ITEM_STATE_VALUE_PATTERN + r"$"
+_ITEM_STATE_RE = re.compile(_ITEM_STATE_PATTERN)
+
+# Operators of ItemStateCondition. Short literals like these are already
+# interned code constants, so every configuration shares the same string objects
+_EQ, _NEQ, _LT, _LTE, _GT, _GTE = ("=", "!=", "<", "<=", ">", ">=")
+
+# Operator groups of _ITEM_STATE_RE and the operator each one maps to
+_ITEM_OP_GROUPS = (("eq", _EQ), ("neq", _NEQ), ("lt", _LT), ("lte", _LTE), ("gt", _GT), ("gte", _GTE))
+
+# Single word operators accepted by ItemStateCondition, which can be resolved
+# without running _ITEM_STATE_RE
+_ITEM_STATE_OPERATORS = {
+    "=": _EQ, "==": _EQ, "eq": _EQ, "equals": _EQ, "is": _EQ,
+    "!=": _NEQ,
+    "<": _LT, "lt": _LT,
+    "<=": _LTE, "lte": _LTE,
+    ">": _GT, "gt": _GT,
+    ">=": _GTE, "gte": _GTE
+}
+
+# The Item name and state parts of _ITEM_STATE_RE on their own, so that the
+# single word operator path reads them with the same grammar
+_ITEM_NAME_RE = re.compile(_ITEM_NAME_PATTERN + r"$")
+_ITEM_STATE_VALUE_RE = re.compile(_ITEM_STATE_VALUE_PATTERN + r"$")
+
+# Words that may precede the Ephemeris daytype, in the order they may appear
+_EPHEMERIS_PREDICATE = ("not", "in", "a")
+
+_TIME_OF_DAY_SUB = r"(([01]?\d|2[0-3]):[0-5]\d)|((0?[1-9]|1[0-2]):[0-5]\d(:[0-5]\d)?\s?(am|pm))"
+_TIME_OF_DAY_PATTERN = r"^time\s+(?P<startTime>" + _TIME_OF_DAY_SUB + r")(?:\s*-\s*|\s+to\s+)(?P<endTime>" + _TIME_OF_DAY_SUB + r")$"
+_TIME_OF_DAY_RE = re.compile(_TIME_OF_DAY_PATTERN)
+
+def _build_condition(condition_name, typeuid, configuration):
+    return ConditionBuilder.create().withId(condition_name).withTypeUID(typeuid).withConfiguration(Configuration(configuration)).build()
+
 class ItemStateCondition(Condition):
     def __init__(self, item_name, operator, state, condition_name=None):
+        if item_name is None or operator is None or state is None:
+            raise ValueError(u"Paramater invalid in call to ItemStateConditon")
+
         condition_name = validate_uid(condition_name)
         configuration = { 
             "itemName": item_name,
             "operator": operator,
             "state": state
         }
-        if any(value is None for value in configuration.values()):
-            raise ValueError(u"Paramater invalid in call to ItemStateConditon")
 
-        self.condition = ConditionBuilder.create().withId(condition_name).withTypeUID("core.ItemStateCondition").withConfiguration(Configuration(configuration)).build()
+        self.condition = _build_condition(condition_name, "core.ItemStateCondition", configuration)
 
-    firstWord = "item"
+    firstWord = frozenset(("item",))
     @classmethod
     def parse(cls, target):
         # @onlyif("Item Test_Switch_2 equals ON")
-        match = re.match(r"^Item\s+(?P<itemName>\w+)\s+((?P<eq>=|==|eq|equals|is)|(?P<neq>!=|not\s+equals|is\s+not)|(?P<lt><|lt|is\s+less\s+than)|(?P<lte><=|lte|is\s+less\s+than\s+or\s+equal)|(?P<gt>>|gt|is\s+greater\s+than)|(?P<gte>>=|gte|is\s+greater\s+than\s+or\s+equal))\s+(?P<state>'[^']+'|\S+)*$", target, re.IGNORECASE)
-        if match is not None:
-            item = getItem(match.group('itemName'))
-            if item is None:
-                raise ValueError(u"Invalid item name: {}".format(match.group('itemName')))
+        arguments = cls._parse_arguments(target)
+        return cls._from_arguments(arguments) if arguments is not None else None
 
-            operators = [("eq", "="), ("neq", "!="), ("lt", "<"), ("lte", "<="), ("gt", ">"), ("gte", ">=")]
-            condition = next((op[1] for op in operators if match.group(op[0]) is not None), None)
+    @classmethod
+    def _parse_arguments(cls, target):
+        parts = target.split(None, 3)
+        operator = _ITEM_STATE_OPERATORS.get(parts[2].lower()) if len(parts) == 4 else None
+        value = _ITEM_STATE_VALUE_RE.match(parts[3]) if operator is not None and parts[0].lower() == "item" and _ITEM_NAME_RE.match(parts[1]) else None
+        if value is not None:
+            itemName, state = parts[1], value.group('state')
+        else:
+            # multi-word operators, e.g. "is not" or "is less than or equal"
+            match = _match_lowered(_ITEM_STATE_RE, target)
+            if match is None:
+                return None
+            groups = _lowered_groups(match, target)
+
+            operator = None
+            for group_name, symbol in _ITEM_OP_GROUPS:
+                if groups[group_name] is not None:
+                    operator = symbol
+                    break
+            itemName, state = groups['itemName'], groups['state']
+
+        return (itemName, operator, state)
 
-            return cls(match.group('itemName'), condition, match.group('state'))
+    @classmethod
+    def _from_arguments(cls, arguments):
+        if getItem(arguments[0]) is None:
+            raise ValueError(u"Invalid item name: {}".format(arguments[0]))
+        return cls(*arguments)
 
 class EphemerisCondition(Condition):
     def __init__(self, dayset, offset=0, condition_name=None):
@@ -92,9 +141,9 @@ class EphemerisCondition(Condition):
             typeuid = "epemeris.DaysetCondition"
             configuration['dayset'] = dayset
 
-        self.condition = ConditionBuilder.create().withId(condition_name).withTypeUID(typeuid).withConfiguration(Configuration(configuration)).build()
+        self.condition = _build_condition(condition_name, typeuid, configuration)
 
-    firstWord = [ "today", "tomorrow", "yesterday", "it's" ]
+    firstWord = frozenset(("today", "tomorrow", "yesterday", "it's", "its"))
     @classmethod
     def parse(cls, target):
         # @onlyif("Today is a holiday")
@@ -106,61 +155,132 @@ class EphemerisCondition(Condition):
         # @onlyif("today offset -3 is a weekend")
         # @onylyf("today minus 3 is not a holiday")
         # @onlyif("yesterday was in dayset")
-        match = re.match(r"""^((?P<today>Today\s+is|it'*s)|(?P<plus1>Tomorrow\s+is|Today\s+plus\s+1)|(?P<minus1>Yesterday\s+was|Today\s+minus\s+1)|(Today\s+(?P<plusminus>plus|minus|offset)\s+(?P<offset>-?\d+)\s+is))\s+  # what day
-                         (?P<not>not\s+)?(in\s+)?(a\s+)?                        # predicate
-                         (?P<daytype>holiday|weekday|weekend|\S+)$""",          # daytype
-                         target, re.IGNORECASE | re.X)
-        if match is not None:
-            daytype = match.group('daytype')
-            if daytype is None:
-                raise ValueError(u"Invalid ephemeris type: {}".format(match.group('daytype')))
-
-            if match.group('today') is not None:
-                offset = 0
-            elif match.group('plus1') is not None:
-                offset = 1
-            elif match.group('minus1') is not None:
-                offset = -1
-            elif match.group('offset') is not None:
-                offset = match.group('offset')
-            else:
-                raise ValueError(u"Offset is not specified")
-            
-            if match.group('not') is not None:
-                if match.group('daytype') == "holiday":
-                    daytype = "notholiday"
-                elif match.group('daytype') == "weekday":
-                    daytype = "weekend"
-                elif match.group('daytype') == "weekend":
-                    daytype = "weekday"
+        arguments = cls._parse_arguments(target)
+        return cls._from_arguments(arguments) if arguments is not None else None
+
+    @classmethod
+    def _parse_arguments(cls, target):
+        tokens = target.split()
+        words = [token.lower() for token in tokens]
+        count = len(words)
+
+        # what day
+        if words[0][:2] == "it" and words[0][-1:] == "s" and words[0][2:-1].strip("'") == "":
+            offset, index = 0, 1
+        elif words[0] == "today" and count > 1:
+            if words[1] == "is":
+                offset, index = 0, 2
+            elif words[1] in ("plus", "minus", "offset") and count > 2:
+                number = words[2][1:] if words[2][:1] == "-" else words[2]
+                if count > 3 and words[3] == "is" and number.isdigit():
+                    offset, index = int(words[2]), 4
+                    if words[1] == "minus":
+                        offset = -offset
+                elif words[2] == "1" and words[1] != "offset":
+                    offset, index = 1 if words[1] == "plus" else -1, 3
                 else:
-                    raise ValueError(u"Unable to negate custom daytype: {}", match.group('daytype'))
+                    return None
             else:
-                daytype = match.group('daytype')
+                return None
+        elif count > 1 and (words[0], words[1]) in (("tomorrow", "is"), ("yesterday", "was")):
+            offset, index = 1 if words[0] == "tomorrow" else -1, 2
+        else:
+            return None
+
+        # predicate
+        negate = False
+        for word in _EPHEMERIS_PREDICATE:
+            if count - index > 1 and words[index] == word:
+                negate = negate or word == "not"
+                index += 1
+
+        # daytype
+        if count - index != 1:
+            return None
+        daytype = words[index] if words[index] in ("holiday", "weekday", "weekend") else tokens[index]
+
+        if negate:
+            if daytype == "holiday":
+                daytype = "notholiday"
+            elif daytype == "weekday":
+                daytype = "weekend"
+            elif daytype == "weekend":
+                daytype = "weekday"
+            else:
+                raise ValueError(u"Unable to negate custom daytype: {}".format(daytype))
 
-            return cls(daytype, offset)
+        return (daytype, offset)
+
+    @classmethod
+    def _from_arguments(cls, arguments):
+        return cls(*arguments)
 
 class TimeOfDayCondition(Condition):
     def __init__(self, startTime, endTime, condition_name=None):
+        if startTime is None or endTime is None:
+            raise ValueError(u"Paramater invalid in call to TimeOfDateCondition")
+
         condition_name = validate_uid(condition_name)
         configuration = { 
             "startTime": startTime,
             "endTime": endTime
         }
-        if any(value is None for value in configuration.values()):
-            raise ValueError(u"Paramater invalid in call to TimeOfDateCondition")
 
-        self.condition = ConditionBuilder.create().withId(condition_name).withTypeUID("core.TimeOfDayCondition").withConfiguration(Configuration(configuration)).build()
+        self.condition = _build_condition(condition_name, "core.TimeOfDayCondition", configuration)
 
-    firstWord = "time"
+    firstWord = frozenset(("time",))
     @classmethod
     def parse(cls, target):
         # @onlyif("Time 9:00 to 14:00")
-        timeOfDayRegEx = r"(([01]?\d|2[0-3]):[0-5]\d)|((0?[1-9]|1[0-2]):[0-5]\d(:[0-5]\d)?\s?(AM|PM))"
-        reFull = r"^Time\s+(?P<startTime>" + timeOfDayRegEx + r")(?:\s*-\s*|\s+to\s+)(?<endTime>" + timeOfDayRegEx + r")$"
-        match = re.match(r"^Time\s+(?P<startTime>" + timeOfDayRegEx + r")(?:\s*-\s*|\s+to\s+)(?P<endTime>" + timeOfDayRegEx + r")$", target, re.IGNORECASE)
-        if match is not None:
-            return cls(match.group('startTime'), match.group('endTime'))
+        arguments = cls._parse_arguments(target)
+        return cls._from_arguments(arguments) if arguments is not None else None
+
+    @classmethod
+    def _parse_arguments(cls, target):
+        match = _match_lowered(_TIME_OF_DAY_RE, target)
+        if match is None:
+            return None
+        groups = _lowered_groups(match, target)
+        return (groups['startTime'], groups['endTime'])
+
+    @classmethod
+    def _from_arguments(cls, arguments):
+        return cls(*arguments)
+
+# Map each lowercased first word to the condition class that can parse it
+_FIRST_WORD_DISPATCH = {}
+for _conditionClass in [ItemStateCondition, EphemerisCondition, TimeOfDayCondition]:
+    for _word in _conditionClass.firstWord:
+        _FIRST_WORD_DISPATCH[_word.lower()] = _conditionClass
+
+def _parse_condition(target):
+    # returns the condition class and the arguments to build the condition from
+    target = target.strip()
+    if len(target) <= 0:
+        raise ValueError(u"expression is length 0")
+
+    firstWord = target.split(None, 1)[0]
+
+    # check first word to eliminate unecessary regex matches
+    conditionClass = _FIRST_WORD_DISPATCH.get(firstWord.lower())
+    if conditionClass is not None:
+        arguments = conditionClass._parse_arguments(target)
+        if arguments is not None:
+            return conditionClass, arguments
+
+    raise ValueError(u"Could not parse {} condition: {}".format(firstWord, target))
+
+def _bad_condition(function):
+    # If there was a problem with a condition configuration, then add None
+    # to the conditions attribute of the callback function, so that
+    # core.rules.rule can identify that there was a problem and not start
+    # the rule
+    conditions = getattr(function, 'conditions', None)
+    if conditions is None:
+        conditions = []
+        function.conditions = conditions
+    conditions.append(None)
+    return function
 
 def onlyif(target):
     """
@@ -170,55 +290,29 @@ def onlyif(target):
     module and allows for them to be used with natural language.
     """
 
-    conditionClasses = [ ItemStateCondition, EphemerisCondition, TimeOfDayCondition ]
-
-    def parse(target):
-        target = target.strip()
-        if len(target) <= 0:
-            raise ValueError(u"expression is length 0")
-
-        firstWord = target.split()[0]
-
-        for conditionClass in conditionClasses:
-            # check first word to eliminate unecessary regex compiles
-            if firstWord.lower() in conditionClass.firstWord:
-                condition = conditionClass.parse(target)
-                if condition is not None:
-                    return condition
-
-        raise ValueError(u"Could not parse {} condition: {}".format(firstWord, target))
-
     try:
-        def onlyifFunction(function):
-            condition = parse(target)
-
-            if condition == None:
-                raise ValueError(u"Invalid condition: {}".format(target))
-
-            if not hasattr(function, 'conditions'):
-                function.conditions = []
-
-            function.conditions.append(condition.condition)
-
-            return function
-
-        return onlyifFunction
-
+        parsed = _PARSE_CACHE.get(target)
+        if parsed is None:
+            parsed = _parse_condition(target)
+            _PARSE_CACHE[target] = parsed
+        conditionClass, arguments = parsed
+        condition = conditionClass._from_arguments(arguments)
     except ValueError as ex:
         log.warn(ex)
+        return _bad_condition
+    except Exception:
+        import traceback
+        log.warn(traceback.format_exc())
+        return _bad_condition
 
-        def bad_condition(function):
-            if not hasattr(function, 'conditions'):
-                function.conditions = []
-            function.conditions.append(None)
-            return function
+    def onlyifFunction(function):
+        conditions = getattr(function, 'conditions', None)
+        if conditions is None:
+            conditions = []
+            function.conditions = conditions
 
-        # If there was a problem with a condition configuration, then add None
-        # to the conditions attribute of the callback function, so that
-        # core.rules.rule can identify that there was a problem and not start
-        # the rule
-        return bad_condition
+        conditions.append(condition.condition)
 
-    except:
-        import traceback
-        log.warn(traceback.format_exc())
\ No newline at end of file
+        return function
+
+    return onlyifFunction
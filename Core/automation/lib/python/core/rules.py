@@ -77,15 +77,19 @@ def rule(name=None, description=None, tags=None):
             return subclass
         else:
             callable_obj = new_rule
-            if callable_obj.triggers.count(None) == 0:
-                simple_rule = _FunctionRule(callable_obj, callable_obj.triggers, callable_obj.conditions if hasattr(callable_obj, "conditions") else None, name=name, description=description, tags=tags)
+            conditions = callable_obj.conditions if hasattr(callable_obj, "conditions") else None
+            if callable_obj.triggers.count(None) != 0:
+                LOG.warn(u"rule: not creating rule '{}' due to an invalid trigger definition".format(name))
+                return None
+            elif conditions is not None and conditions.count(None) != 0:
+                LOG.warn(u"rule: not creating rule '{}' due to an invalid condition definition".format(name))
+                return None
+            else:
+                simple_rule = _FunctionRule(callable_obj, callable_obj.triggers, conditions, name=name, description=description, tags=tags)
                 new_rule = addRule(simple_rule)
                 callable_obj.UID = new_rule.UID
                 callable_obj.triggers = None
                 return callable_obj
-            else:
-                LOG.warn(u"rule: not creating rule '{}' due to an invalid trigger definition".format(name))
-                return None
     return rule_decorator
 
 class _FunctionRule(SimpleRule):
@@ -23,6 +23,10 @@ for more details):
 * **ChannelEventTrigger** - fires when a Channel reports an Event
 * **StartupTrigger** - fires when the rule is activated **(implemented in Jython and requires S1566, 2.5M2 or newer)**
 * **DirectoryEventTrigger** - fires when a directory reports an Event **(implemented in Jython and requires S1566, 2.5M2 or newer)**
+
+Triggers with the same type and configuration share one ``Configuration``
+instance, so the configuration of a trigger created by this module must not be
+modified in place.
 """
 try:
     # pylint: disable=unused-import
@@ -40,48 +44,39 @@ except:
 from core.jsr223.scope import scriptExtension
 scriptExtension.importPreset("RuleSupport")
 from core.jsr223.scope import TriggerBuilder, Configuration, Trigger
-from core.utils import validate_uid
+from core.utils import validate_uid, _match_lowered, _lowered_groups
 from core.log import getLogger
 import re
 
-from os import path
-
-try:
-    from org.openhab.core.thing import ChannelUID, ThingUID, ThingStatus
-    from org.openhab.core.thing.type import ChannelKind
-except:
-    from org.eclipse.smarthome.core.thing import ChannelUID, ThingUID, ThingStatus
-    from org.eclipse.smarthome.core.thing.type import ChannelKind
-
 try:
-    from org.eclipse.smarthome.core.types import TypeParser
+    from org.openhab.core.thing import ChannelUID, ThingUID
 except:
-        from org.openhab.core.types import TypeParser
+    from org.eclipse.smarthome.core.thing import ChannelUID, ThingUID
 
 from java.nio.file import StandardWatchEventKinds
 ENTRY_CREATE = StandardWatchEventKinds.ENTRY_CREATE  # type: WatchEvent.Kind
 ENTRY_DELETE = StandardWatchEventKinds.ENTRY_DELETE  # type: WatchEvent.Kind
 ENTRY_MODIFY = StandardWatchEventKinds.ENTRY_MODIFY  # type: WatchEvent.Kind
 
+# DirectoryEventTrigger options and their event kinds, in the order they are
+# passed to the watcher
+_DIR_EVENT_KINDS = (("created", ENTRY_CREATE), ("deleted", ENTRY_DELETE), ("modified", ENTRY_MODIFY))
+_DIR_OPTIONS_SEPARATOR_RE = re.compile(r"[,\s]+")
+
 try:
     from org.quartz.CronExpression import isValidExpression
 except:
     # Quartz is removed in OH3, this needs to either impliment or match
     # functionality in `org.openhab.core.internal.scheduler.CronAdjuster`
+    _CRON_NAMED_RE = re.compile(r"@(annually|yearly|monthly|weekly|daily|hourly|reboot)\Z")
+    # a field is accepted when it starts with ?, *, a number or a three letter
+    # name, matching the per-field check this replaces
+    _CRON_FIELD = r"(?:[?*\d]|\w{3})\S*"
+    _CRON_FULL_RE = re.compile(_CRON_FIELD + r"(?:\s+" + _CRON_FIELD + r"){5,6}\Z")
+
     def isValidExpression(expr):
         expr = expr.strip()
-        if expr.startswith("@"):
-            return re.match(r"@(annually|yearly|monthly|weekly|daily|hourly|reboot)", expr) is not None
-
-        parts = expr.split()
-        if 6 <= len(parts) <= 7:
-            for i in range(len(parts)):
-                if not re.match(
-                    r"\?|(\*|\d+)(\/\d+)?|(\d+|\w{3})(\/|-)(\d+|\w{3})|((\d+|\w{3}),)*(\d+|\w{3})", parts[i]
-                ):
-                    return False
-            return True
-            return False
+        return (_CRON_NAMED_RE if expr[:1] == "@" else _CRON_FULL_RE).match(expr) is not None
 
 # Lazy load itemRegistry
 itemRegistry = None
@@ -105,51 +100,140 @@ def getThing(thingUID):
         things = scriptExtension.get("things") #type t_things
     return things.get(ThingUID(thingUID))
 
+# Configurations keyed by trigger type and sorted properties. Many rules use
+# identical trigger configurations, so one instance is shared between triggers
+# of the same type, across every script that imports this module. A shared
+# Configuration must not be modified: a write through
+# trigger.getConfiguration() would change it for every other trigger sharing
+# it. The rule registry's in-place normalization is the exception, since it
+# gives the same result for every trigger of the type. The cache is cleared
+# when it reaches _CONFIGURATION_CACHE_SIZE entries, so it cannot grow without
+# bound as scripts reload.
+_CONFIGURATION_CACHE = {}
+_CONFIGURATION_CACHE_SIZE = 1024
+def _shared_configuration(type_uid, configuration):
+    try:
+        key = (type_uid, tuple(sorted(configuration.items())))
+        shared = _CONFIGURATION_CACHE.get(key)
+    except TypeError:
+        # unhashable values, e.g. a list of event types
+        return Configuration(configuration)
+    if shared is None:
+        if len(_CONFIGURATION_CACHE) >= _CONFIGURATION_CACHE_SIZE:
+            _CONFIGURATION_CACHE.clear()
+        shared = Configuration(configuration)
+        _CONFIGURATION_CACHE[key] = shared
+    return shared
+
+def _event_configuration(event_topic, event_source, event_types):
+    return _shared_configuration("core.GenericEventTrigger", {
+        "eventTopic": event_topic,
+        "eventSource": event_source,
+        "eventTypes": event_types
+    })
+
+def _expand_group(item, subItems):
+    # names of the Items that a "Member of" or "Descendent of" trigger applies to
+    members = item.getMembers() if subItems.lower() == "member" else item.getAllMembers()
+    return tuple(member.name for member in members)
+
 LOG = getLogger(u"core.triggers")
 
+# Parsed when targets, as the function and arguments that build their trigger
+# objects, since the same literals recur across rules. Each use still builds
+# its own triggers, so ids are unique, Items are validated and group members
+# are expanded again.
+_PARSE_CACHE = {}
+
+# Trigger patterns, matched with core.utils._match_lowered, so their keywords
+# are lowercase
+_STARTUP_RE = re.compile(r"^system\s+(?:started|reached\s+start\s+level\s+(?P<startLevel>\d+))$")
+_CRON_RE = re.compile(r"^time\s+(?:cron\s+(?P<cronExpression>.*)|is\s+(?P<namedInstant>midnight|noon))$")
+_DT_RE = re.compile(r"^time\s+is\s+(?P<itemName>\S*)(?:\s+\[(?P<timeOnly>timeonly)\])*$")
+_ISU_RE = re.compile(r"^(?:(?P<subItems>member|descendent)\s+of|item)\s+(?P<itemName>\w+)\s+received\s+update(?:\s+(?P<state>'[^']+'|\S+))*$")
+_ISC_RE = re.compile(r"^(?:(?P<subItems>member|descendent)\s+of|item)\s+(?P<itemName>\w+)\s+changed(?:\s+from\s+(?P<previousState>'[^']+'|\S+))*(?:\s+to\s+(?P<state>'[^']+'|\S+))*$")
+_IC_RE = re.compile(r"^(?:(?P<subItems>member|descendent)\s+of|item)\s+(?P<itemName>\w+)\s+received\s+command(?:\s+(?P<command>\w+))*$")
+_TSU_RE = re.compile(r"^thing\s+(?P<thingUID>\S+)\s+received\s+update(?:\s+(?P<status>\w+))*$")
+_TSC_RE = re.compile(r"^thing\s+(?P<thingUID>\S+)\s+changed(?:\s+from\s+(?P<previousState>\w+))*(?:\s+to\s+(?P<state>\w+))*$")
+_CH_RE = re.compile(r'^channel\s+\"*(?P<channelUID>\S+)\"*\s+triggered(?:\s+(?P<event>\w+))*$')
+_DIR_RE = re.compile(r"^(?P<dirOrSub>directory|subdirectory)\s+(?P<path>'.+'|\S+)\s+\[(?P<options>(?:(?:,\s*)*(?:created|deleted|modified))+)\]$")
+
+# Fixed phrases that are looked up directly instead of through a regex
+_NAMED_INSTANTS = {
+    "time is midnight": "0 0 0 * * ?",
+    "time is noon": "0 0 12 * * ?"
+}
+_ITEM_EVENTS = {
+    "item added": "ItemAddedEvent",
+    "item removed": "ItemRemovedEvent",
+    "item updated": "ItemUpdatedEvent"
+}
+_THING_EVENTS = {
+    "thing added": "ThingAddedEvent",
+    "thing removed": "ThingRemovedEvent",
+    "thing updated": "ThingUpdatedEvent"
+}
+
 class StartupTrigger(Trigger):
     def __init__(self, startLevel=None, trigger_name=None):
         trigger_name = validate_uid(trigger_name)
         if startLevel is None:
             startLevel = 40
-        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.SystemStartlevelTrigger").withConfiguration(Configuration({
+        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.SystemStartlevelTrigger").withConfiguration(_shared_configuration("core.SystemStartlevelTrigger", {
             "startlevel": startLevel
         })).build()
 
-    firstWord = "system"
+    _regex = _STARTUP_RE
+    firstWord = frozenset(("system",))
     @classmethod
     def parse(cls, target):
         # @when("System started")# requires S1566, 2.5M2 or newer ('System shuts down' has not been implemented)
         # @when("System reached start level 50")
-        match = re.match(r"^System\s+(?:started|reached\s+start\s+level\s+(?P<startLevel>\d+))$", target, re.IGNORECASE)
+        if target.lower() == "system started":
+            return (cls(None),)
+        match = _match_lowered(cls._regex, target)
         if match is not None:
-            return cls(match.group('startLevel'))
+            return cls._from_match(_lowered_groups(match, target))
+
+    @classmethod
+    def _from_match(cls, groups):
+        return (cls(groups['startLevel']),)
 
 class CronTrigger(Trigger):
     def __init__(self, cron_expression, trigger_name=None):
         trigger_name = validate_uid(trigger_name)
         configuration = {'cronExpression': cron_expression}
-        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("timer.GenericCronTrigger").withConfiguration(Configuration(configuration)).build()
+        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("timer.GenericCronTrigger").withConfiguration(_shared_configuration("timer.GenericCronTrigger", configuration)).build()
             
-    firstWord = "time"
+    _regex = _CRON_RE
+    firstWord = frozenset(("time",))
     @classmethod
     def parse(cls, target):
         # @when("Time cron 55 55 5 * * ?")
         # @when("Time is midnight")
         # @when("Time is noon")
-        match = re.match(r"^Time\s+(?:cron\s+(?P<cronExpression>.*)|is\s+(?P<namedInstant>midnight|noon))$", target, re.IGNORECASE)
+        cronExpression = _NAMED_INSTANTS.get(target.lower())
+        if cronExpression is not None:
+            return (cls(cronExpression),)
+
+        match = _match_lowered(cls._regex, target)
         if match is not None:
-            if match.group('namedInstant') is None:
-                cronExpression = match.group('cronExpression')
-            elif match.group(2) == "midnight":
-                cronExpression = "0 0 0 * * ?"
-            else:   # noon
-                cronExpression = "0 0 12 * * ?"
+            return cls._from_match(_lowered_groups(match, target))
+
+        if isValidExpression(target):
+            return (cls(target),)
+
+        return None
+
+    @classmethod
+    def _from_match(cls, groups):
+        if groups['namedInstant'] is None:
+            cronExpression = groups['cronExpression']
         else:
-            cronExpression = target
+            cronExpression = _NAMED_INSTANTS["time is " + groups['namedInstant'].lower()]
 
         if isValidExpression(cronExpression):
-            return cls(cronExpression)
+            return (cls(cronExpression),)
 
         return None
 
@@ -159,18 +243,23 @@ class DateTimeTrigger(Trigger):
         configuration = { 'itemName': itemName }
         if timeOnly is not None:
             configuration["timeOnly"] = timeOnly
-        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("timer.DateTimeTrigger").withConfiguration(Configuration(configuration)).build()
+        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("timer.DateTimeTrigger").withConfiguration(_shared_configuration("timer.DateTimeTrigger", configuration)).build()
 
-    firstWord = "time"
+    _regex = _DT_RE
+    firstWord = frozenset(("time",))
     @classmethod
     def parse(cls, target):
         # @when("Time is itemName")
-        match = re.match(r"^Time\s+is\s+(?P<itemName>\S*)(?:\s+\[(?P<timeOnly>timeOnly)\])*$", target, re.IGNORECASE)
+        match = _match_lowered(cls._regex, target)
         if match is not None:
-            item = getItem(match.group('itemName'))
-            if item is None:
-                raise ValueError(u"Invalid item name: {}".format(match.group('itemName')))
-            return cls(match.group('itemName'), match.group('timeOnly') == "timeOnly")
+            return cls._from_match(_lowered_groups(match, target))
+
+    @classmethod
+    def _from_match(cls, groups):
+        item = getItem(groups['itemName'])
+        if item is None:
+            raise ValueError(u"Invalid item name: {}".format(groups['itemName']))
+        return (cls(groups['itemName'], groups['timeOnly'] is not None),)
 
 class ItemStateUpdateTrigger(Trigger):
     def __init__(self, item_name, state=None, trigger_name=None):
@@ -178,25 +267,30 @@ class ItemStateUpdateTrigger(Trigger):
         configuration = {"itemName": item_name}
         if state is not None:
             configuration["state"] = state
-        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.ItemStateUpdateTrigger").withConfiguration(Configuration(configuration)).build()
+        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.ItemStateUpdateTrigger").withConfiguration(_shared_configuration("core.ItemStateUpdateTrigger", configuration)).build()
 
-    firstWord = [ "item", "member", "descendent" ]
+    _regex = _ISU_RE
+    firstWord = frozenset(("item", "member", "descendent"))
     @classmethod
     def parse(cls, target):
         # @when("Item Test_Switch_2 received update ON")
         # @when("Member of gIrrigationEvents received update")
         # TODO - add support for TimeOnly flag
-        match = re.match(r"^(?:(?P<subItems>Member|Descendent)\s+of|Item)\s+(?P<itemName>\w+)\s+received\s+update(?:\s+(?P<state>'[^']+'|\S+))*$", target, re.IGNORECASE)
+        match = _match_lowered(cls._regex, target)
         if match is not None:
-            item = getItem(match.group('itemName'))
-            if item is None:
-                raise ValueError(u"Invalid item name: {}".format(match.group('itemName')))
+            return cls._from_match(_lowered_groups(match, target))
 
-            if match.group('subItems') is None:
-                return cls(match.group('itemName'), match.group('state'))
+    @classmethod
+    def _from_match(cls, groups):
+        item = getItem(groups['itemName'])
+        if item is None:
+            raise ValueError(u"Invalid item name: {}".format(groups['itemName']))
 
-            groupMembers = item.getMembers() if match.group('subItems') == "Member" else item.getAllMembers()
-            return list(map(lambda item: cls(item.name, match.group('state')), groupMembers)) 
+        if groups['subItems'] is None:
+            return (cls(groups['itemName'], groups['state']),)
+
+        state = groups['state']
+        return [cls(name, state) for name in _expand_group(item, groups['subItems'])]
 
 class ItemStateChangeTrigger(Trigger):
     def __init__(self, item_name, previous_state=None, state=None, trigger_name=None):
@@ -206,26 +300,31 @@ class ItemStateChangeTrigger(Trigger):
             configuration["state"] = state
         if previous_state is not None:
             configuration["previousState"] = previous_state
-        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.ItemStateChangeTrigger").withConfiguration(Configuration(configuration)).build()
+        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.ItemStateChangeTrigger").withConfiguration(_shared_configuration("core.ItemStateChangeTrigger", configuration)).build()
 
-    firstWord = [ "item", "member", "descendent" ]
+    _regex = _ISC_RE
+    firstWord = frozenset(("item", "member", "descendent"))
     @classmethod
     def parse(cls, target):
         # @when("Item Test_String_1 changed from 'old test string' to 'new test string'")
         # @when("Item gMotion_Sensors changed")
         # @when("Member of gMotion_Sensors changed from ON to OFF")
         # @when("Descendent of gContact_Sensors changed from OPEN to CLOSED")
-        match = re.match(r"^(?:(?P<subItems>Member|Descendent)\s+of|Item)\s+(?P<itemName>\w+)\s+changed(?:\s+from\s+(?P<previousState>'[^']+'|\S+))*(?:\s+to\s+(?P<state>'[^']+'|\S+))*$", target, re.IGNORECASE)
+        match = _match_lowered(cls._regex, target)
         if match is not None:
-            item = getItem(match.group('itemName'))
-            if item is None:
-                raise ValueError(u"Invalid item name: {}".format(match.group('itemName')))
+            return cls._from_match(_lowered_groups(match, target))
+
+    @classmethod
+    def _from_match(cls, groups):
+        item = getItem(groups['itemName'])
+        if item is None:
+            raise ValueError(u"Invalid item name: {}".format(groups['itemName']))
 
-            if match.group('subItems') is None:
-                return cls(match.group('itemName'), match.group('previousState'), match.group('state'))
+        if groups['subItems'] is None:
+            return (cls(groups['itemName'], groups['previousState'], groups['state']),)
 
-            groupMembers = item.getMembers() if match.group('subItems') == "Member" else item.getAllMembers()
-            return list(map(lambda item: cls(item.name, match.group('previousState'), match.group('state')), groupMembers)) 
+        previousState, state = groups['previousState'], groups['state']
+        return [cls(name, previousState, state) for name in _expand_group(item, groups['subItems'])]
 
 class ItemCommandTrigger(Trigger):
     def __init__(self, item_name, command=None, trigger_name=None):
@@ -234,23 +333,28 @@ class ItemCommandTrigger(Trigger):
         configuration = {"itemName": item_name}
         if command is not None:
             configuration["command"] = command
-        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.ItemCommandTrigger").withConfiguration(Configuration(configuration)).build()
+        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.ItemCommandTrigger").withConfiguration(_shared_configuration("core.ItemCommandTrigger", configuration)).build()
 
-    firstWord = [ "item", "member", "descendent" ]
+    _regex = _IC_RE
+    firstWord = frozenset(("item", "member", "descendent"))
     @classmethod
     def parse(cls, target):
         # @when("Item Test_Switch_1 received command OFF")
-        match = re.match(r"^(?:(?P<subItems>Member|Descendent)\s+of|Item)\s+(?P<itemName>\w+)\s+received\s+command(?:\s+(?P<command>\w+))*$", target, re.IGNORECASE)
+        match = _match_lowered(cls._regex, target)
         if match is not None:
-            item = getItem(match.group('itemName'))
-            if item is None:
-                raise ValueError(u"Invalid item name: {}".format(match.group('itemName')))
+            return cls._from_match(_lowered_groups(match, target))
+
+    @classmethod
+    def _from_match(cls, groups):
+        item = getItem(groups['itemName'])
+        if item is None:
+            raise ValueError(u"Invalid item name: {}".format(groups['itemName']))
 
-            if match.group('subItems') is None:
-                return cls(match.group('itemName'), match.group('command'))
+        if groups['subItems'] is None:
+            return (cls(groups['itemName'], groups['command']),)
 
-            groupMembers = item.getMembers() if match.group('subItems') == "Member" else item.getAllMembers()
-            return list(map(lambda item: cls(item.name, match.group('command')), groupMembers)) 
+        command = groups['command']
+        return [cls(name, command) for name in _expand_group(item, groups['subItems'])]
 
 class ThingStatusUpdateTrigger(Trigger):
     def __init__(self, thing_uid, status=None, trigger_name=None):
@@ -258,17 +362,22 @@ class ThingStatusUpdateTrigger(Trigger):
         configuration = {"thingUID": thing_uid}
         if status is not None:
             configuration["status"] = status
-        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.ThingStatusUpdateTrigger").withConfiguration(Configuration(configuration)).build()
+        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.ThingStatusUpdateTrigger").withConfiguration(_shared_configuration("core.ThingStatusUpdateTrigger", configuration)).build()
 
-    firstWord = "thing"
+    _regex = _TSU_RE
+    firstWord = frozenset(("thing",))
     @classmethod
     def parse(cls, target):
         # @when("Thing kodi:kodi:familyroom received update ONLINE")# requires S1636, 2.5M2 or newer
-        match = re.match(r"^Thing\s+(?P<thingUID>\S+)\s+received\s+update(?:\s+(?P<status>\w+))*$", target, re.IGNORECASE)
+        match = _match_lowered(cls._regex, target)
         if match is not None:
-            if getThing(match.group('thingUID')) is None:
-                raise ValueError(u"Invalid thing UID: {}".format(match.group('thingUID')))
-            return cls(match.group('thingUID'), match.group('status'))
+            return cls._from_match(_lowered_groups(match, target))
+
+    @classmethod
+    def _from_match(cls, groups):
+        if getThing(groups['thingUID']) is None:
+            raise ValueError(u"Invalid thing UID: {}".format(groups['thingUID']))
+        return (cls(groups['thingUID'], groups['status']),)
 
 class ThingStatusChangeTrigger(Trigger):
     def __init__(self, thing_uid, previous_status=None, status=None, trigger_name=None):
@@ -278,16 +387,21 @@ class ThingStatusChangeTrigger(Trigger):
             configuration["previousStatus"] = previous_status
         if status is not None:
             configuration["status"] = status
-        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.ThingStatusChangeTrigger").withConfiguration(Configuration(configuration)).build()
+        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.ThingStatusChangeTrigger").withConfiguration(_shared_configuration("core.ThingStatusChangeTrigger", configuration)).build()
 
-    firstWord = "thing"
+    _regex = _TSC_RE
+    firstWord = frozenset(("thing",))
     @classmethod
     def parse(cls, target):
-        match = re.match(r"^Thing\s+(?P<thingUID>\S+)\s+changed(?:\s+from\s+(?P<previousState>\w+))*(?:\s+to\s+(?P<state>\w+))*$", target, re.IGNORECASE)
+        match = _match_lowered(cls._regex, target)
         if match is not None:
-            if getThing(match.group('thingUID')) is None:
-                raise ValueError(u"Invalid thing UID: {}".format(match.group('thingUID')))
-            return cls(match.group('thingUID'), match.group('previousState'), match.group('state'))
+            return cls._from_match(_lowered_groups(match, target))
+
+    @classmethod
+    def _from_match(cls, groups):
+        if getThing(groups['thingUID']) is None:
+            raise ValueError(u"Invalid thing UID: {}".format(groups['thingUID']))
+        return (cls(groups['thingUID'], groups['previousState'], groups['state']),)
 
 class ChannelEventTrigger(Trigger):
     def __init__(self, channel_uid, event=None, trigger_name=None):
@@ -295,75 +409,62 @@ class ChannelEventTrigger(Trigger):
         configuration = {"channelUID": channel_uid}
         if event is not None:
             configuration["event"] = event
-        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.ChannelEventTrigger").withConfiguration(Configuration(configuration)).build()
+        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.ChannelEventTrigger").withConfiguration(_shared_configuration("core.ChannelEventTrigger", configuration)).build()
 
-    firstWord = "channel"
+    _regex = _CH_RE
+    firstWord = frozenset(("channel",))
     @classmethod
     def parse(cls, target):
         # @when("Thing kodi:kodi:familyroom changed")
         # @when("Thing kodi:kodi:familyroom changed from ONLINE to OFFLINE")# requires S1636, 2.5M2 or newer
-        match = re.match(r'^Channel\s+\"*(?P<channelUID>\S+)\"*\s+triggered(?:\s+(?P<event>\w+))*$', target, re.IGNORECASE)
+        match = _match_lowered(cls._regex, target)
         if match is not None:
-            if getChannel(match.group('channelUID')) is None:
-                raise ValueError(u"Invalid channel UID: {}".format(match.group('channelUID'))) 
-            return cls(match.group('channelUID'), match.group('event'))
+            return cls._from_match(_lowered_groups(match, target))
+
+    @classmethod
+    def _from_match(cls, groups):
+        if getChannel(groups['channelUID']) is None:
+            raise ValueError(u"Invalid channel UID: {}".format(groups['channelUID'])) 
+        return (cls(groups['channelUID'], groups['event']),)
 
 class GenericEventTrigger(Trigger):
     def __init__(self, event_source, event_types, event_topic="smarthome/*", trigger_name=None):
         trigger_name = validate_uid(trigger_name)
-        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.GenericEventTrigger").withConfiguration(Configuration({
-            "eventTopic": event_topic,
-            "eventSource": event_source,
-            "eventTypes": event_types
-        })).build()
+        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.GenericEventTrigger").withConfiguration(_event_configuration(event_topic, event_source, event_types)).build()
 
 class ItemEventTrigger(Trigger):
     def __init__(self, event_types, item_name=None, trigger_name=None):
         trigger_name = validate_uid(trigger_name)
-        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.GenericEventTrigger").withConfiguration(Configuration({
-            "eventTopic": "smarthome/items/*",
-            "eventSource": "smarthome/items/{}".format("{}/".format(item_name) if item_name else ""),
-            "eventTypes": event_types
-        })).build()
+        event_source = self._eventSource + item_name + "/" if item_name else self._eventSource
+        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.GenericEventTrigger").withConfiguration(_event_configuration("smarthome/items/*", event_source, event_types)).build()
 
-    firstWord = "item"
+    _eventSource = "smarthome/items/"
+    firstWord = frozenset(("item",))
     @classmethod
     def parse(cls, target):
         # @when("Item added")
         # @when("Item removed")
         # @when("Item updated")
-        match = re.match(r"^Item\s+(?P<action>added|removed|updated)$", target, re.IGNORECASE)
-        if match is not None:
-            event_names = {
-                "added": "ItemAddedEvent",
-                "removed": "ItemRemovedEvent",
-                "updated": "ItemUpdatedEvent"
-            }
-            return cls(event_names.get(match.group('action')))
+        event_name = _ITEM_EVENTS.get(" ".join(target.lower().split()))
+        if event_name is not None:
+            return (cls(event_name),)
 
 class ThingEventTrigger(Trigger):
     def __init__(self, event_types, thing_uid=None, trigger_name=None):
         trigger_name = validate_uid(trigger_name)
-        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.GenericEventTrigger").withConfiguration(Configuration({
-            "eventTopic": "smarthome/things/*",
-            "eventSource": "smarthome/things/{}".format("{}/".format(thing_uid) if thing_uid else ""),
-            "eventTypes": event_types
-        })).build()
+        event_source = self._eventSource + thing_uid + "/" if thing_uid else self._eventSource
+        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("core.GenericEventTrigger").withConfiguration(_event_configuration("smarthome/things/*", event_source, event_types)).build()
 
-    firstWord = "thing"
+    _eventSource = "smarthome/things/"
+    firstWord = frozenset(("thing",))
     @classmethod
     def parse(cls, target):
         # @when("Thing added")
         # @when("Thing removed")
         # @when("Thing updated")
-        match = re.match(r"^Thing\s+(?P<action>added|removed|updated)$", target, re.IGNORECASE)
-        if match is not None:
-            event_names = {
-                "added": "ThingAddedEvent",
-                "removed": "ThingRemovedEvent",
-                "updated": "ThingUpdatedEvent"
-            }
-            return cls(event_names.get(match.group('action')))
+        event_name = _THING_EVENTS.get(" ".join(target.lower().split()))
+        if event_name is not None:
+            return (cls(event_name),)
 
 
 class DirectoryEventTrigger(Trigger):
@@ -374,27 +475,58 @@ class DirectoryEventTrigger(Trigger):
             'event_kinds': str(event_kinds),
             'watch_subdirectories': watch_subdirectories,
         }
-        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("jsr223.DirectoryEventTrigger").withConfiguration(Configuration(configuration)).build()
+        self.trigger = TriggerBuilder.create().withId(trigger_name).withTypeUID("jsr223.DirectoryEventTrigger").withConfiguration(_shared_configuration("jsr223.DirectoryEventTrigger", configuration)).build()
 
-    firstWord = [ "directory", "subdirectory" ]
+    _regex = _DIR_RE
+    firstWord = frozenset(("directory", "subdirectory"))
     @classmethod
     def parse(cls, target):
         # @when("Directory /opt/test [created, deleted, modified]")# requires S1566, 2.5M2 or newer
         # @when("Subdirectory 'C:\My Stuff' [created]")# requires S1566, 2.5M2 or newer
-        match = re.match(r"^(?P<dirOrSub>Directory|Subdirectory)\s+(?P<path>'.+'|\S+)\s+\[(?P<options>(?:(?:,\s*)*(?:created|deleted|modified))+)\]$", target, re.IGNORECASE)
+        match = _match_lowered(cls._regex, target)
         if match is not None:
-            event_kinds = []
-            options = match.group('options').split()
-            if "created" in options:
-                event_kinds.append(ENTRY_CREATE)
-            if "deleted" in options:
-                event_kinds.append(ENTRY_DELETE)
-            if "modified" in options:
-                event_kinds.append(ENTRY_MODIFY)
-            if event_kinds == []:
-                event_kinds = [ENTRY_CREATE, ENTRY_DELETE, ENTRY_MODIFY]
-            
-            return cls(match.group('path'), event_kinds, (match.group('dirOrSub') == "Subdirectory"))
+            return cls._from_match(_lowered_groups(match, target))
+
+    @classmethod
+    def _from_match(cls, groups):
+        options = frozenset(_DIR_OPTIONS_SEPARATOR_RE.split(groups['options'].lower()))
+        event_kinds = [kind for option, kind in _DIR_EVENT_KINDS if option in options] or [ENTRY_CREATE, ENTRY_DELETE, ENTRY_MODIFY]
+
+        return (cls(groups['path'], event_kinds, (groups['dirOrSub'].lower() == "subdirectory")),)
+
+# Map each lowercased first word to the trigger classes that can parse it, in
+# the order they are tried
+_FIRSTWORD_DISPATCH = {}
+for _triggerClass in [StartupTrigger, CronTrigger, DateTimeTrigger, ItemStateUpdateTrigger, ItemStateChangeTrigger, ChannelEventTrigger,
+                      ItemEventTrigger, ItemCommandTrigger, ThingStatusUpdateTrigger, ThingStatusChangeTrigger, ThingEventTrigger, DirectoryEventTrigger]:
+    for _word in _triggerClass.firstWord:
+        _FIRSTWORD_DISPATCH.setdefault(_word.lower(), []).append(_triggerClass)
+
+# One regex per first word that combines the patterns of its candidate classes,
+# so that a single match selects the class and extracts its fields. The
+# candidate's index prefixes its group names, since several patterns share them.
+_FIRSTWORD_RE = {}
+for _word, _triggerClasses in _FIRSTWORD_DISPATCH.items():
+    _patterns = []
+    for _index, _triggerClass in enumerate(_triggerClasses):
+        if hasattr(_triggerClass, "_regex"):
+            _pattern = re.sub(r"\(\?P<(\w+)>", r"(?P<t{}_\1>".format(_index), _triggerClass._regex.pattern)
+            _patterns.append("(?P<t{}>{})".format(_index, _pattern))
+    if _patterns:
+        _FIRSTWORD_RE[_word] = re.compile("|".join(_patterns))
+
+# Fixed phrases of all classes, normalized to lowercase words separated by
+# single spaces, with the class and the argument that build their trigger
+_FIXED_PHRASES = {"system started": (StartupTrigger, None)}
+for _phrase, _cronExpression in _NAMED_INSTANTS.items():
+    _FIXED_PHRASES[_phrase] = (CronTrigger, _cronExpression)
+for _phrase, _eventName in _ITEM_EVENTS.items():
+    _FIXED_PHRASES[_phrase] = (ItemEventTrigger, _eventName)
+for _phrase, _eventName in _THING_EVENTS.items():
+    _FIXED_PHRASES[_phrase] = (ThingEventTrigger, _eventName)
+
+def _build_single(triggerClass, argument):
+    return (triggerClass(argument),)
 
 def when(target):
     """
@@ -405,38 +537,54 @@ def when(target):
     is used in the rules DSL.
     """
 
-    triggerClasses = [ StartupTrigger, CronTrigger, DateTimeTrigger, ItemStateUpdateTrigger, ItemStateChangeTrigger, ChannelEventTrigger,
-                  ItemEventTrigger, ItemCommandTrigger, ThingStatusUpdateTrigger, ThingStatusChangeTrigger, ThingEventTrigger, DirectoryEventTrigger ]
-
     def parse(target):
+        # returns the trigger objects for target, along with the function and
+        # arguments that build them again for a later use of the same target
         target = target.strip()
 
-        firstWord = target.split()[0]
+        firstWord = target.split(None, 1)[0]
+        firstWordLower = firstWord.lower()
 
-        for triggerClass in triggerClasses:
-            # check first word to eliminate unecessary regex compiles
-            if firstWord.lower() in triggerClass.firstWord:
-                trigger = triggerClass.parse(target)
-                if trigger is not None:
-                    return trigger
+        fixed = _FIXED_PHRASES.get(" ".join(target.lower().split()))
+        if fixed is not None:
+            return _build_single(*fixed), _build_single, fixed
+
+        # check first word to eliminate unecessary regex matches
+        triggerClasses = _FIRSTWORD_DISPATCH.get(firstWordLower, ())
+        combined = _FIRSTWORD_RE.get(firstWordLower)
+        match = _match_lowered(combined, target) if combined is not None else None
+        if match is not None:
+            prefix = match.lastgroup
+            from_match, groups = triggerClasses[int(prefix[1:])]._from_match, _lowered_groups(match, target, prefix + "_")
+            triggers = from_match(groups)
+            if triggers is not None:
+                return triggers, from_match, (groups,)
+
+        # the fixed phrases and regexes cover every class, apart from cron
+        # expressions given without "cron"
+        if match is None and firstWordLower in CronTrigger.firstWord and isValidExpression(target):
+            return _build_single(CronTrigger, target), _build_single, (CronTrigger, target)
 
         raise ValueError(u"Could not parse {} trigger: {}".format(firstWord, target))
 
     try:
         def whenFunction(function):
-            triggerClasses = parse(target)
+            parsed = _PARSE_CACHE.get(target)
+            if parsed is None:
+                triggerClasses, build, arguments = parse(target)
+                _PARSE_CACHE[target] = (build, arguments)
+            else:
+                build, arguments = parsed
+                triggerClasses = build(*arguments)
 
-            if triggerClasses == None:
-                raise ValueError(u"Invalid trigger: {}".format(target))
+            triggers = [triggerClass.trigger for triggerClass in triggerClasses]
 
-            if not hasattr(function, 'triggers'):
-                function.triggers = []
+            functionTriggers = getattr(function, 'triggers', None)
+            if functionTriggers is None:
+                functionTriggers = []
+                function.triggers = functionTriggers
 
-            if isinstance(triggerClasses, list):
-                for triggerClass in triggerClasses:
-                    function.triggers.append(triggerClass.trigger)
-            else:
-                function.triggers.append(triggerClasses.trigger)
+            functionTriggers.extend(triggers)
 
             return function
 
@@ -446,9 +594,11 @@ def when(target):
         LOG.warn(ex)
 
         def bad_trigger(function):
-            if not hasattr(function, 'triggers'):
-                function.triggers = []
-            function.triggers.append(None)
+            functionTriggers = getattr(function, 'triggers', None)
+            if functionTriggers is None:
+                functionTriggers = []
+                function.triggers = functionTriggers
+            functionTriggers.append(None)
             return function
 
         # If there was a problem with a trigger configuration, then add None
@@ -119,6 +119,31 @@ def validate_uid(uid):
     return uid
 
 
+def _match_lowered(regex, target):
+    # Used by core.triggers and core.conditions. Their patterns only contain
+    # lowercase keywords and are matched against a lowercased copy of the
+    # target, so re does not have to case-fold every character it inspects. If
+    # lowercasing changes the length of the target, it is matched
+    # case-insensitively instead, so the spans of the match always index into
+    # the original target.
+    lowered = target.lower()
+    if len(lowered) != len(target):
+        return re.match(regex.pattern, target, regex.flags | re.IGNORECASE)
+    return regex.match(lowered)
+
+
+def _lowered_groups(match, target, prefix=""):
+    # Reads the named groups of a _match_lowered match from the original target,
+    # so Item names, states and other values keep their case. Only groups whose
+    # names start with prefix are read, with the prefix removed.
+    groups = {}
+    for name in match.re.groupindex:
+        if name.startswith(prefix):
+            start, end = match.span(name)
+            groups[name[len(prefix):]] = target[start:end] if start != -1 else None
+    return groups
+
+
 def post_update_if_different(item_or_item_name, new_value, sendACommand=False, floatPrecision=None):
     """
     Checks if the current state of the item is different than the desired new